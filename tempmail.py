@@ -11,40 +11,65 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import logging
 import os
 import platform
 import random
+import secrets
+import socket
 import string
 import sys
+import threading
 import time
 import traceback
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    # Only needed for annotations; it is imported where large histories are mapped
+    import mmap
+
+# Legacy Windows consoles don't understand ANSI escapes; Windows Terminal,
+# ANSICON and VS Code do. Everything else is assumed to be ANSI-capable.
+_ANSI_CLEAR = (
+    platform.system() != "Windows"
+    or "WT_SESSION" in os.environ
+    or "ANSICON" in os.environ
+    or os.environ.get("TERM_PROGRAM") == "vscode"
+)
 
 # Clear screen function
 def clear_screen():
-    """Clear the terminal screen based on the operating system."""
-    if platform.system() == "Windows":
+    """Clear the terminal screen, writing ANSI escapes where supported."""
+    # Piped or redirected output shouldn't start with escape codes
+    if not sys.stdout.isatty():
+        return
+    if not _ANSI_CLEAR:
         os.system("cls")
-    else:
-        os.system("clear")
+        return
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
 # Clear the screen immediately when script starts
 clear_screen()
 
+# Panel, Progress and Table are imported where they are used so that
+# --help, --version and plain/piped runs don't pay for them at startup
 try:
     import requests
     from rich.console import Console
     from rich.logging import RichHandler
-    from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.table import Table
-    from rich.text import Text
     from rich.theme import Theme
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Required dependencies not found. Installing...")
     import subprocess
@@ -52,11 +77,16 @@ except ImportError:
     import requests
     from rich.console import Console
     from rich.logging import RichHandler
-    from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.table import Table
-    from rich.text import Text
     from rich.theme import Theme
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+    from urllib3.util.retry import Retry
+
+# orjson is optional; fall back to the stdlib parser when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up rich console with custom theme
 custom_theme = Theme({
@@ -83,80 +113,293 @@ logging.basicConfig(
 
 LOGGER = logging.getLogger("temp-mail-watcher")
 
+##############################################################################
+# JSON helpers
+##############################################################################
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or text, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumpb(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize obj to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
 ##############################################################################
 # Configuration and state management
 ##############################################################################
 
 CONFIG_DIR = Path.home() / ".config" / "tempmail-watcher"
 CONFIG_FILE = CONFIG_DIR / "config.json"
-HISTORY_FILE = CONFIG_DIR / "history.json"
+HISTORY_FILE = CONFIG_DIR / "history.jsonl"
+# Pre-JSON Lines history; converted once, then kept as history.json.migrated
+LEGACY_HISTORY_FILE = CONFIG_DIR / "history.json"
 
 def ensure_config_dir() -> None:
     """Ensure the configuration directory exists."""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
+DEFAULT_CONFIG: Dict[str, Any] = {
+    "default_provider": "mail.tm",
+    "poll_interval": 5,
+    "max_history_entries": 50,
+    "save_messages": True,
+    "display_mode": "rich",
+}
+
+# In-memory copy of the config file; only re-read when the file changes on disk
+_CONFIG_CACHE: Optional[Dict[str, Any]] = None
+_CONFIG_MTIME: float = 0.0
+
+def _config_mtime() -> Optional[float]:
+    """Return the config file's mtime, or None if it does not exist."""
+    try:
+        return CONFIG_FILE.stat().st_mtime
+    except OSError:
+        return None
+
 def load_config() -> Dict[str, Any]:
     """Load configuration from file or return defaults."""
-    if not CONFIG_FILE.exists():
-        return {
-            "default_provider": "mail.tm",
-            "poll_interval": 5,
-            "max_history_entries": 50,
-            "save_messages": True,
-            "display_mode": "rich",
-        }
+    global _CONFIG_CACHE, _CONFIG_MTIME
+    
+    mtime = _config_mtime()
+    if _CONFIG_CACHE is not None and (mtime is None or mtime == _CONFIG_MTIME):
+        return _CONFIG_CACHE
+    
+    if mtime is None:
+        _CONFIG_CACHE = dict(DEFAULT_CONFIG)
+        return _CONFIG_CACHE
     
     try:
-        with open(CONFIG_FILE, "r") as f:
-            return json.load(f)
+        with open(CONFIG_FILE, "rb") as f:
+            _CONFIG_CACHE = _loads(f.read())
     except Exception as e:
         LOGGER.warning(f"Failed to load config: {e}. Using defaults.")
-        return {
-            "default_provider": "mail.tm",
-            "poll_interval": 5,
-            "max_history_entries": 50,
-            "save_messages": True,
-            "display_mode": "rich",
-        }
+        _CONFIG_CACHE = dict(DEFAULT_CONFIG)
+    _CONFIG_MTIME = mtime
+    return _CONFIG_CACHE
 
 def save_config(config: Dict[str, Any]) -> None:
     """Save configuration to file."""
+    global _CONFIG_CACHE, _CONFIG_MTIME
+    
     ensure_config_dir()
     try:
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=2)
+        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+            f.write(_dumps(config, indent=True))
     except Exception as e:
         LOGGER.error(f"Failed to save config: {e}")
+    
+    # Keep the in-memory copy authoritative so later reads skip the disk
+    _CONFIG_CACHE = config
+    _CONFIG_MTIME = _config_mtime() or 0.0
 
-def save_message_to_history(provider: str, address: str, message: Dict[str, Any]) -> None:
-    """Save a received message to history."""
-    config = load_config()
+# Large buffers keep whole-file history reads and rewrites to a few syscalls
+HISTORY_READ_BUFFER = 1 << 20
+HISTORY_WRITE_BUFFER = 512 * 1024
+
+# Number of lines in HISTORY_FILE, tracked in-process so appends never re-read it
+_HISTORY_LINES: Optional[int] = None
+_HISTORY_LOCK = threading.Lock()
+
+# Set once this process has deleted the history, so later views, exports and
+# clears can answer without touching the filesystem until something is saved
+_HISTORY_KNOWN_EMPTY = False
+
+def _mark_history_dirty() -> None:
+    """Note that the history file has been written to."""
+    global _HISTORY_KNOWN_EMPTY
+    _HISTORY_KNOWN_EMPTY = False
+
+# Below this size the history is read in one go rather than line by line
+SMALL_HISTORY_BYTES = 2 * 1024 * 1024
+
+def _migrate_legacy_history() -> bool:
+    """Convert an old history.json array into the JSON Lines history file.
+    
+    Only runs while history.jsonl does not exist. The old file is renamed
+    afterwards so clearing the new history never brings it back.
+    """
+    if not LEGACY_HISTORY_FILE.exists():
+        return False
+    
+    try:
+        with open(LEGACY_HISTORY_FILE, "rb") as f:
+            history = _loads(f.read())
+        tmp_file = HISTORY_FILE.with_suffix(".tmp")
+        with open(tmp_file, "wb", buffering=HISTORY_WRITE_BUFFER) as f:
+            for entry in history:
+                f.write(_dumpb(entry) + b"\n")
+        os.replace(tmp_file, HISTORY_FILE)
+        LEGACY_HISTORY_FILE.replace(LEGACY_HISTORY_FILE.with_suffix(".json.migrated"))
+    except (OSError, ValueError, TypeError) as e:
+        LOGGER.warning(f"Failed to migrate {LEGACY_HISTORY_FILE.name}: {e}")
+        return False
+    return True
+
+def _history_stat() -> Optional[os.stat_result]:
+    """Stat the history file once, returning None if it does not exist."""
+    try:
+        return os.stat(HISTORY_FILE)
+    except FileNotFoundError:
+        pass
+    if _migrate_legacy_history():
+        return os.stat(HISTORY_FILE)
+    return None
+
+def _count_history_lines() -> int:
+    """Count the entries currently stored in the history file."""
+    if _history_stat() is None:
+        return 0
+    with open(HISTORY_FILE, "rb", buffering=HISTORY_READ_BUFFER) as f:
+        return sum(1 for line in f if line.strip())
+
+def _trim_history(max_entries: int) -> None:
+    """Rewrite the history file keeping only the newest max_entries lines."""
+    global _HISTORY_LINES
+    
+    with open(HISTORY_FILE, "rb", buffering=HISTORY_READ_BUFFER) as f:
+        lines = [line for line in f if line.strip()]
+    lines = lines[-max_entries:]
+    
+    tmp_file = HISTORY_FILE.with_suffix(".tmp")
+    with open(tmp_file, "wb", buffering=HISTORY_WRITE_BUFFER) as f:
+        f.writelines(lines)
+    os.replace(tmp_file, HISTORY_FILE)
+    _HISTORY_LINES = len(lines)
+
+# Parsed history from the last full read, keyed on the file's mtime, size and
+# the entry limit, so repeated views within a session skip re-parsing
+_HISTORY_CACHE: Optional[Tuple[Tuple[int, int, int], List[Dict[str, Any]]]] = None
+
+def _history_cache_key(st: os.stat_result) -> Tuple[int, int, int]:
+    """Return the key under which a history file with this stat would be cached."""
+    return st.st_mtime_ns, st.st_size, load_config().get("max_history_entries", 50)
+
+def _history_tail(mm: mmap.mmap, max_entries: int) -> Tuple[int, int]:
+    """Find where the newest max_entries non-empty lines of a mapping start.
+    
+    Walks backwards from the end, so only the tail of a large history is
+    ever paged in. Returns the start offset and the number of lines found.
+    """
+    pos = len(mm)
+    found = 0
+    while pos > 0 and found < max_entries:
+        line_start = mm.rfind(b"\n", 0, pos - 1) + 1
+        if mm[line_start:pos].strip():
+            found += 1
+        pos = line_start
+    return pos, found
+
+def _history_size(st: Optional[os.stat_result] = None) -> int:
+    """Return how many entries _iter_history() will yield."""
+    st = st or _history_stat()
+    if st is None:
+        return 0
+    if _HISTORY_CACHE is not None and _HISTORY_CACHE[0] == _history_cache_key(st):
+        return len(_HISTORY_CACHE[1])
+    if st.st_size < SMALL_HISTORY_BYTES:
+        # Parsing a small file is cheap, and it leaves the entries cached
+        # for the _iter_history() call that follows
+        return len(_load_history(st))
+    import mmap
+    
+    max_entries = load_config().get("max_history_entries", 50)
+    with open(HISTORY_FILE, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _history_tail(mm, max_entries)[1]
+
+def _iter_history(st: Optional[os.stat_result] = None) -> Iterator[Dict[str, Any]]:
+    """Yield the newest history entries, parsing one line at a time."""
+    global _HISTORY_CACHE
+    
+    st = st or _history_stat()
+    if st is None:
+        return
+    
+    key = _history_cache_key(st)
+    if _HISTORY_CACHE is not None and _HISTORY_CACHE[0] == key:
+        yield from _HISTORY_CACHE[1]
+        return
+    
+    max_entries = key[2]
+    entries = []
+    with open(HISTORY_FILE, "rb", buffering=HISTORY_READ_BUFFER) as f:
+        if st.st_size < SMALL_HISTORY_BYTES:
+            # Small files: one read, and the line count comes for free
+            lines = [line for line in f.read().splitlines() if line.strip()]
+            for line in lines[max(0, len(lines) - max_entries):]:
+                entry = _loads(line)
+                entries.append(entry)
+                yield entry
+        else:
+            import mmap
+            
+            # Large files: map them and parse straight from the page cache,
+            # starting at the first line that will actually be shown
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                mm.seek(_history_tail(mm, max_entries)[0])
+                for line in iter(mm.readline, b""):
+                    if line.strip():
+                        entry = _loads(line)
+                        entries.append(entry)
+                        yield entry
+    
+    # Only cache once the whole file has been read
+    _HISTORY_CACHE = (key, entries)
+
+def _load_history(st: Optional[os.stat_result] = None) -> List[Dict[str, Any]]:
+    """Load the newest history entries from the JSON Lines history file."""
+    return list(_iter_history(st))
+
+def save_message_to_history(
+    provider: str,
+    address: str,
+    message: Dict[str, Any],
+    config: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Append a received message to the history file."""
+    global _HISTORY_LINES
+    
+    if config is None:
+        config = load_config()
     if not config.get("save_messages", True):
         return
     
     ensure_config_dir()
     
     try:
-        if HISTORY_FILE.exists():
-            with open(HISTORY_FILE, "r") as f:
-                history = json.load(f)
-        else:
-            history = []
-        
-        history.append({
+        entry = {
             "provider": provider,
             "address": address,
             "timestamp": datetime.now().isoformat(),
             "message": message
-        })
-        
-        # Limit history size
-        max_entries = config.get("max_history_entries", 50)
-        if len(history) > max_entries:
-            history = history[-max_entries:]
+        }
+        line = _dumpb(entry) + b"\n"
         
-        with open(HISTORY_FILE, "w") as f:
-            json.dump(history, f, indent=2)
+        # Several providers may be watched at once; keep appends and trims atomic
+        with _HISTORY_LOCK:
+            if _HISTORY_LINES is None:
+                _HISTORY_LINES = _count_history_lines()
+            
+            with open(HISTORY_FILE, "ab", buffering=1 << 16) as f:
+                f.write(line)
+            _HISTORY_LINES += 1
+            _mark_history_dirty()
+            
+            # Limit history size lazily so most writes stay a single append
+            max_entries = config.get("max_history_entries", 50)
+            if _HISTORY_LINES > max_entries * 1.5:
+                _trim_history(max_entries)
     except Exception as e:
         LOGGER.warning(f"Failed to save message to history: {e}")
 
@@ -164,18 +407,32 @@ def save_message_to_history(provider: str, address: str, message: Dict[str, Any]
 # Utility helpers
 ##############################################################################
 
+_ALPHABET = string.ascii_lowercase + string.digits
+
 def _rand_string(n: int = 10) -> str:
     """Generate a random alphanumeric string of length n."""
-    return "".join(random.choice(string.ascii_lowercase + string.digits) for _ in range(n))
+    return "".join(random.choices(_ALPHABET, k=n))
 
+# Fallback formats for timestamps that datetime.fromisoformat() cannot parse
+_TS_FORMATS = ("%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d %H:%M:%S")
+
+# Timestamps repeat a lot across history views and message bursts
+@functools.lru_cache(maxsize=4096)
 def _format_timestamp(timestamp: Optional[str]) -> str:
     """Format a timestamp in a human-readable way."""
     if not timestamp:
         return "unknown time"
     
     try:
+        # Most providers send ISO-8601, which fromisoformat parses in C
+        try:
+            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            return dt.strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            pass
+        
         # Try different timestamp formats
-        for fmt in ("%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d %H:%M:%S"):
+        for fmt in _TS_FORMATS:
             try:
                 dt = datetime.strptime(timestamp, fmt)
                 return dt.strftime("%Y-%m-%d %H:%M:%S")
@@ -187,6 +444,8 @@ def _format_timestamp(timestamp: Optional[str]) -> str:
     except Exception:
         return timestamp
 
+_EMAIL_PANEL_STYLE: Dict[str, Any] = {"title_align": "left", "border_style": "cyan"}
+
 def _print_email_rich(
     provider: str,
     sender: Optional[str],
@@ -195,22 +454,25 @@ def _print_email_rich(
     body: Optional[str],
 ) -> None:
     """Print an email using rich formatting."""
-    # Instead of using a Table object, create a simple string representation directly
+    from rich.markup import escape
+    from rich.panel import Panel
+    
+    # Instead of using a Table object, create a simple string representation directly.
+    # Message fields are escaped so brackets in them aren't parsed as markup
     email_info = []
-    email_info.append(f"[bold]From:[/] [email_from]{sender or '(unknown)'}[/]")
-    email_info.append(f"[bold]Subject:[/] [email_subject]{subject or '(no subject)'}[/]")
+    email_info.append(f"[bold]From:[/] [email_from]{escape(sender or '(unknown)')}[/]")
+    email_info.append(f"[bold]Subject:[/] [email_subject]{escape(subject or '(no subject)')}[/]")
     if date_:
-        email_info.append(f"[bold]Date:[/] [email_date]{_format_timestamp(date_)}[/]")
+        email_info.append(f"[bold]Date:[/] [email_date]{escape(_format_timestamp(date_))}[/]")
     
     email_header = "\n".join(email_info)
     
-    formatted_body = body.strip() if body else "(no body)"
+    formatted_body = escape(body.strip()) if body else "(no body)"
     
     panel = Panel(
         f"{email_header}\n\n{formatted_body}", 
-        title=f"New Email [{provider}]",
-        title_align="left",
-        border_style="cyan"
+        title=escape(f"New Email [{provider}]"),
+        **_EMAIL_PANEL_STYLE,
     )
     
     console.print(panel)
@@ -223,15 +485,19 @@ def _print_email_plain(
     body: Optional[str],
 ) -> None:
     """Print an email in plain text format."""
-    print("─" * 60)
-    print(f"[{provider}] New Email")
-    print(f"From:    {sender or '(unknown)'}")
-    print(f"Subject: {subject or '(no subject)'}")
+    lines = [
+        "─" * 60,
+        f"[{provider}] New Email",
+        f"From:    {sender or '(unknown)'}",
+        f"Subject: {subject or '(no subject)'}",
+    ]
     if date_:
-        print(f"Date:    {_format_timestamp(date_)}")
-    print()
-    print(body.strip() if body else "(no body)")
-    print(flush=True)
+        lines.append(f"Date:    {_format_timestamp(date_)}")
+    lines += ["", body.strip() if body else "(no body)", "", ""]
+    
+    # One write per email, so listeners in other threads can't interleave lines
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
 
 def print_email(
     provider: str,
@@ -241,9 +507,11 @@ def print_email(
     date_: Optional[str],
     body: Optional[str],
     message_data: Dict[str, Any],
+    config: Optional[Dict[str, Any]] = None,
 ) -> None:
     """Print an email message with the configured display format."""
-    config = load_config()
+    if config is None:
+        config = load_config()
     
     if config.get("display_mode", "rich") == "rich":
         _print_email_rich(provider, sender, subject, date_, body)
@@ -257,20 +525,94 @@ def print_email(
         "date": date_,
         "body": body,
         "raw_data": message_data
-    })
+    }, config=config)
 
 ##############################################################################
 # Provider implementations
 ##############################################################################
 
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that enables TCP keepalive on pooled connections.
+    
+    Long gaps between polls otherwise let NATs and load balancers silently
+    drop idle sockets, turning the next poll into a slow reconnect.
+    """
+    
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
 def make_requests_session(timeout: int = 15) -> requests.Session:
     """Create a requests session with proper headers and timeout."""
     session = requests.Session()
     session.headers.update({
         "User-Agent": "TempMailWatcher/2.0 (https://github.com/zebbern/temp-mail-watcher)"
     })
+    # Keep connections alive between polls so each cycle skips the TLS handshake,
+    # and quietly retry the gateway errors these free services hand out
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"]),
+        raise_on_status=False,
+    )
+    adapter = KeepAliveAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     return session
 
+# Matches the session's pool_maxsize so parallel fetches never queue for a socket
+FETCH_WORKERS = 4
+
+def _fetch_concurrently(
+    fetch: Callable[[str], Dict[str, Any]],
+    ids: List[str],
+) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+    """Fetch several messages in parallel, returning (id, message) pairs in order.
+    
+    A failed fetch is logged and yields None for that ID, so one bad message
+    doesn't stop the rest of the burst from being shown.
+    """
+    def fetch_one(message_id: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Fetch one message, turning errors into None."""
+        try:
+            return message_id, fetch(message_id)
+        except Exception as e:
+            LOGGER.warning(f"Failed to fetch message {message_id}: {e}")
+            return message_id, None
+    
+    if len(ids) <= 1:
+        return [fetch_one(i) for i in ids]
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(ids))) as ex:
+        return list(ex.map(fetch_one, ids))
+
+_SPINNER_LOCK = threading.Lock()
+
+@contextmanager
+def setup_spinner(label: str) -> Iterator[None]:
+    """Show a transient spinner while a provider account is being set up."""
+    # No spinner thread when output is piped or the user asked for plain text
+    if not console.is_terminal or load_config().get("display_mode", "rich") != "rich":
+        console.print(f"Setting up {label} account...")
+        yield
+        return
+    
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
+    # Rich allows a single live display per console, so concurrent providers
+    # take turns showing their setup spinner
+    with _SPINNER_LOCK, Progress(
+        SpinnerColumn(),
+        TextColumn(f"[bold cyan]Setting up {label} account..."),
+        console=console,
+        transient=True,
+    ) as progress:
+        progress.add_task("setup", total=None)
+        yield
+
 class ProviderError(Exception):
     """Base exception for provider errors."""
     pass
@@ -283,6 +625,78 @@ class APIError(ProviderError):
     """API response errors."""
     pass
 
+def _check_response(res: requests.Response) -> None:
+    """Raise APIError for 4xx/5xx responses."""
+    # Compare the status directly; Response.ok goes through raise_for_status()
+    if res.status_code >= 400:
+        raise APIError(f"HTTP {res.status_code} from {res.url}")
+
+def _json_response(res: requests.Response) -> Any:
+    """Check a response and decode its JSON body, treating empty bodies as {}."""
+    _check_response(res)
+    if res.status_code in (204, 304) or not res.content:
+        return {}
+    return _loads(res.content)
+
+class SeenIds:
+    """Insertion-ordered set of message IDs that forgets the oldest past maxlen."""
+    
+    def __init__(self, maxlen: int = 1024) -> None:
+        self.maxlen = maxlen
+        self._ids: OrderedDict[str, None] = OrderedDict()
+    
+    def __contains__(self, message_id: object) -> bool:
+        return message_id in self._ids
+    
+    def add(self, message_id: str) -> None:
+        """Remember a message ID, evicting the oldest one if over capacity."""
+        self._ids[message_id] = None
+        self._ids.move_to_end(message_id)
+        if len(self._ids) > self.maxlen:
+            self._ids.popitem(last=False)
+
+class PollBackoff:
+    """Adaptive polling interval for the provider loops.
+    
+    Idle polls stretch the interval geometrically (up to MAX_IDLE_INTERVAL),
+    failed polls back off exponentially with jitter (up to MAX_ERROR_INTERVAL),
+    and any new message snaps the interval back to the configured value.
+    """
+    
+    MAX_IDLE_INTERVAL = 60
+    MAX_ERROR_INTERVAL = 120
+    
+    def __init__(self, poll: int) -> None:
+        self.poll = poll
+        self.interval: float = poll
+        self.empty_polls = 0
+    
+    def record(self, new_messages: int) -> None:
+        """Update the interval after a successful poll."""
+        if new_messages:
+            self.empty_polls = 0
+            self.interval = self.poll
+            return
+        
+        self.empty_polls += 1
+        idle = self.poll * (2 ** min(self.empty_polls, 4))
+        self.interval = max(self.poll, min(idle, self.MAX_IDLE_INTERVAL))
+    
+    def record_error(self) -> None:
+        """Update the interval after a failed poll."""
+        self.interval = min(self.interval * 2, self.MAX_ERROR_INTERVAL) + random.uniform(0, 1)
+    
+    def sleep(self) -> None:
+        """Sleep for the current interval."""
+        time.sleep(self.interval)
+
+def print_polling_notice(poll: int) -> None:
+    """Tell the user how often the inbox will be checked."""
+    interval = f"every [bold]{poll}s[/]"
+    if poll < PollBackoff.MAX_IDLE_INTERVAL:
+        interval += f" (backing off to {PollBackoff.MAX_IDLE_INTERVAL}s when idle)"
+    console.print(f"Polling {interval} for new messages. Press [bold]Ctrl+C[/] to stop.\n")
+
 ##############################################################################
 # Provider 1 – GuerrillaMail
 ##############################################################################
@@ -295,20 +709,12 @@ def run_guerrillamail(poll: int = 5) -> None:
     sess = make_requests_session()
     sess.headers.update({"User-Agent": GM_UA})
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold cyan]Setting up GuerrillaMail account..."),
-        console=console,
-        transient=True,
-    ) as progress:
-        progress.add_task("setup", total=None)
-        
+    with setup_spinner("GuerrillaMail"):
         try:
             # Get address & sid token
             params = {"f": "get_email_address", "ip": "127.0.0.1", "agent": GM_UA}
             res = sess.get(GM_API, params=params, timeout=15)
-            res.raise_for_status()
-            init = res.json()
+            init = _json_response(res)
             
             sid = init["sid_token"]
             address = init["email_addr"]
@@ -318,28 +724,35 @@ def run_guerrillamail(poll: int = 5) -> None:
             raise APIError(f"API error: {e}") from e
     
     console.print(f"[success]✓[/] Email address ready: [bold]{address}[/]")
-    console.print(f"Polling every [bold]{poll}s[/] for new messages. Press [bold]Ctrl+C[/] to stop.\n")
+    print_polling_notice(poll)
     
-    seen: Set[str] = set()
+    def fetch_message(mail_id: str) -> Dict[str, Any]:
+        """Fetch the full contents of a single message."""
+        params = {"f": "fetch_email", "sid_token": sid, "email_id": mail_id}
+        full_res = sess.get(GM_API, params=params, timeout=15)
+        return _json_response(full_res)
+    
+    seen = SeenIds()
+    backoff = PollBackoff(poll)
+    config = load_config()
+    last_etag: Optional[str] = None
     try:
         while True:
             try:
                 params = {"f": "check_email", "sid_token": sid, "seq": 0}
-                box_res = sess.get(GM_API, params=params, timeout=15)
-                box_res.raise_for_status()
-                box = box_res.json()
+                headers = {"If-None-Match": last_etag} if last_etag else None
+                box_res = sess.get(GM_API, params=params, headers=headers, timeout=15)
+                # A 304 means the inbox is unchanged and decodes to an empty body
+                box = _json_response(box_res)
                 
-                for m in box.get("list", []):
-                    if m["mail_id"] in seen:
+                new_ids = [m["mail_id"] for m in box.get("list", []) if m["mail_id"] not in seen]
+                
+                new_messages = 0
+                for message_id, full in _fetch_concurrently(fetch_message, new_ids):
+                    if full is None:
+                        # Left unseen so the next poll retries it
                         continue
                     
-                    seen.add(m["mail_id"])
-                    
-                    params = {"f": "fetch_email", "sid_token": sid, "email_id": m["mail_id"]}
-                    full_res = sess.get(GM_API, params=params, timeout=15)
-                    full_res.raise_for_status()
-                    full = full_res.json()
-                    
                     print_email(
                         "guerrillamail",
                         address,
@@ -348,13 +761,25 @@ def run_guerrillamail(poll: int = 5) -> None:
                         full.get("mail_date"),
                         full.get("mail_body", ""),
                         full,
+                        config=config,
                     )
+                    seen.add(message_id)
+                    new_messages += 1
+                
+                # Only remember the ETag once every new message has been shown,
+                # otherwise a 304 on the next poll would hide the failed ones
+                if box_res.status_code != 304 and new_messages == len(new_ids):
+                    last_etag = box_res.headers.get("ETag")
+                
+                backoff.record(new_messages)
             except requests.RequestException as e:
-                LOGGER.warning(f"Network error during polling: {e}")
+                LOGGER.warning(f"[guerrillamail] Network error during polling: {e}")
+                backoff.record_error()
             except Exception as e:
-                LOGGER.warning(f"Error during polling: {e}")
+                LOGGER.warning(f"[guerrillamail] Error during polling: {e}")
+                backoff.record_error()
             
-            time.sleep(poll)
+            backoff.sleep()
     except KeyboardInterrupt:
         console.print("[info]Stopped listening; goodbye![/]")
 
@@ -366,67 +791,67 @@ def run_mail_tm(poll: int = 5) -> None:
     """Run the mail.tm provider listener."""
     BASE = "https://api.mail.tm"
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold cyan]Setting up mail.tm account..."),
-        console=console,
-        transient=True,
-    ) as progress:
-        progress.add_task("setup", total=None)
-        
+    sess = make_requests_session()
+    
+    with setup_spinner("mail.tm"):
         try:
             # Get available domains
-            domains_res = requests.get(f"{BASE}/domains?page=1", timeout=15)
-            domains_res.raise_for_status()
-            domain = domains_res.json()["hydra:member"][0]["domain"]
+            domains_res = sess.get(f"{BASE}/domains?page=1", timeout=15)
+            domain = _json_response(domains_res)["hydra:member"][0]["domain"]
             
             # Create random account
             address = f"{_rand_string()}@{domain}"
-            password = _rand_string(12)
+            password = secrets.token_urlsafe(12)
             
-            account_res = requests.post(
+            account_res = sess.post(
                 f"{BASE}/accounts", 
                 json={"address": address, "password": password},
                 timeout=15
             )
-            account_res.raise_for_status()
+            _check_response(account_res)
             
             # Get authentication token
-            token_res = requests.post(
+            token_res = sess.post(
                 f"{BASE}/token", 
                 json={"address": address, "password": password},
                 timeout=15
             )
-            token_res.raise_for_status()
-            auth = token_res.json()["token"]
+            auth = _json_response(token_res)["token"]
             
-            headers = {"Authorization": f"Bearer {auth}"}
+            sess.headers.update({"Authorization": f"Bearer {auth}"})
         except requests.RequestException as e:
             raise NetworkError(f"Network error: {e}") from e
         except Exception as e:
             raise APIError(f"API error: {e}") from e
     
     console.print(f"[success]✓[/] Email address ready: [bold]{address}[/]")
-    console.print(f"Polling every [bold]{poll}s[/] for new messages. Press [bold]Ctrl+C[/] to stop.\n")
+    print_polling_notice(poll)
     
-    seen: Set[str] = set()
+    def fetch_message(message_id: str) -> Dict[str, Any]:
+        """Fetch the full contents of a single message."""
+        full_res = sess.get(f"{BASE}/messages/{message_id}", timeout=15)
+        return _json_response(full_res)
+    
+    seen = SeenIds()
+    backoff = PollBackoff(poll)
+    config = load_config()
+    last_etag: Optional[str] = None
     try:
         while True:
             try:
-                inbox_res = requests.get(f"{BASE}/messages", headers=headers, timeout=15)
-                inbox_res.raise_for_status()
-                inbox = inbox_res.json()["hydra:member"]
+                headers = {"If-None-Match": last_etag} if last_etag else None
+                inbox_res = sess.get(f"{BASE}/messages", headers=headers, timeout=15)
+                # A 304 means the inbox is unchanged and decodes to an empty body
+                inbox = _json_response(inbox_res).get("hydra:member", [])
                 
-                for m in inbox:
-                    if m["id"] in seen:
+                new_ids = [m["id"] for m in inbox if m["id"] not in seen]
+                
+                new_messages = 0
+                for message_id, full in _fetch_concurrently(fetch_message, new_ids):
+                    if full is None:
+                        # Left unseen so the next poll retries it
                         continue
                     
-                    seen.add(m["id"])
-                    
-                    full_res = requests.get(f"{BASE}/messages/{m['id']}", headers=headers, timeout=15)
-                    full_res.raise_for_status()
-                    full = full_res.json()
-                    
                     print_email(
                         "mail.tm",
                         address,
@@ -435,13 +860,25 @@ def run_mail_tm(poll: int = 5) -> None:
                         full.get("createdAt"),
                         full.get("text", ""),
                         full,
+                        config=config,
                     )
+                    seen.add(message_id)
+                    new_messages += 1
+                
+                # Only remember the ETag once every new message has been shown,
+                # otherwise a 304 on the next poll would hide the failed ones
+                if inbox_res.status_code != 304 and new_messages == len(new_ids):
+                    last_etag = inbox_res.headers.get("ETag")
+                
+                backoff.record(new_messages)
             except requests.RequestException as e:
-                LOGGER.warning(f"Network error during polling: {e}")
+                LOGGER.warning(f"[mail.tm] Network error during polling: {e}")
+                backoff.record_error()
             except Exception as e:
-                LOGGER.warning(f"Error during polling: {e}")
+                LOGGER.warning(f"[mail.tm] Error during polling: {e}")
+                backoff.record_error()
             
-            time.sleep(poll)
+            backoff.sleep()
     except KeyboardInterrupt:
         console.print("[info]Stopped listening; goodbye![/]")
 
@@ -453,21 +890,14 @@ def run_tempmail_lol(poll: int = 5, rush: bool = False) -> None:
     """Run the tempmail.lol provider listener."""
     BASE = "https://api.tempmail.lol"
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold cyan]Setting up tempmail.lol account..."),
-        console=console,
-        transient=True,
-    ) as progress:
-        progress.add_task("setup", total=None)
-        
+    sess = make_requests_session()
+    
+    with setup_spinner("tempmail.lol"):
         try:
             # Get address (optionally use rush endpoint)
             endpoint = f"{BASE}/generate/rush" if rush else f"{BASE}/generate"
-            gen_res = requests.get(endpoint, timeout=15)
-            gen_res.raise_for_status()
-            
-            data = gen_res.json()
+            gen_res = sess.get(endpoint, timeout=15)
+            data = _json_response(gen_res)
             address = data["address"]
             token = data["token"]
         except requests.RequestException as e:
@@ -476,17 +906,18 @@ def run_tempmail_lol(poll: int = 5, rush: bool = False) -> None:
             raise APIError(f"API error: {e}") from e
     
     console.print(f"[success]✓[/] Email address ready: [bold]{address}[/]")
-    console.print(f"Polling every [bold]{poll}s[/] for new messages. Press [bold]Ctrl+C[/] to stop.\n")
+    print_polling_notice(poll)
     
-    seen: Set[str] = set()
+    seen = SeenIds()
+    backoff = PollBackoff(poll)
+    config = load_config()
     try:
         while True:
             try:
-                inbox_res = requests.get(f"{BASE}/auth/{token}", timeout=15)
-                inbox_res.raise_for_status()
-                
-                msgs = inbox_res.json().get("email", [])
+                inbox_res = sess.get(f"{BASE}/auth/{token}", timeout=15)
+                msgs = _json_response(inbox_res).get("email", [])
                 
+                new_messages = 0
                 for m in msgs:
                     # Create a message ID from content to track seen messages
                     msg_id = f"{m.get('from')}_{m.get('subject')}_{len(m.get('body', ''))}"
@@ -504,13 +935,19 @@ def run_tempmail_lol(poll: int = 5, rush: bool = False) -> None:
                         None,  # No date provided by this API
                         m.get("body", ""),
                         m,
+                        config=config,
                     )
+                    new_messages += 1
+                
+                backoff.record(new_messages)
             except requests.RequestException as e:
-                LOGGER.warning(f"Network error during polling: {e}")
+                LOGGER.warning(f"[tempmail.lol] Network error during polling: {e}")
+                backoff.record_error()
             except Exception as e:
-                LOGGER.warning(f"Error during polling: {e}")
+                LOGGER.warning(f"[tempmail.lol] Error during polling: {e}")
+                backoff.record_error()
             
-            time.sleep(poll)
+            backoff.sleep()
     except KeyboardInterrupt:
         console.print("[info]Stopped listening; goodbye![/]")
 
@@ -522,67 +959,67 @@ def run_mail_gw(poll: int = 5) -> None:
     """Run the mail.gw provider listener."""
     BASE = "https://api.mail.gw"
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold cyan]Setting up mail.gw account..."),
-        console=console,
-        transient=True,
-    ) as progress:
-        progress.add_task("setup", total=None)
-        
+    sess = make_requests_session()
+    
+    with setup_spinner("mail.gw"):
         try:
             # Get available domains
-            domains_res = requests.get(f"{BASE}/domains?page=1", timeout=15)
-            domains_res.raise_for_status()
-            domain = domains_res.json()["hydra:member"][0]["domain"]
+            domains_res = sess.get(f"{BASE}/domains?page=1", timeout=15)
+            domain = _json_response(domains_res)["hydra:member"][0]["domain"]
             
             # Create random account
             address = f"{_rand_string()}@{domain}"
-            password = _rand_string(12)
+            password = secrets.token_urlsafe(12)
             
-            account_res = requests.post(
+            account_res = sess.post(
                 f"{BASE}/accounts", 
                 json={"address": address, "password": password},
                 timeout=15
             )
-            account_res.raise_for_status()
+            _check_response(account_res)
             
             # Get authentication token
-            token_res = requests.post(
+            token_res = sess.post(
                 f"{BASE}/token", 
                 json={"address": address, "password": password},
                 timeout=15
             )
-            token_res.raise_for_status()
-            auth = token_res.json()["token"]
+            auth = _json_response(token_res)["token"]
             
-            headers = {"Authorization": f"Bearer {auth}"}
+            sess.headers.update({"Authorization": f"Bearer {auth}"})
         except requests.RequestException as e:
             raise NetworkError(f"Network error: {e}") from e
         except Exception as e:
             raise APIError(f"API error: {e}") from e
     
     console.print(f"[success]✓[/] Email address ready: [bold]{address}[/]")
-    console.print(f"Polling every [bold]{poll}s[/] for new messages. Press [bold]Ctrl+C[/] to stop.\n")
+    print_polling_notice(poll)
     
-    seen: Set[str] = set()
+    def fetch_message(message_id: str) -> Dict[str, Any]:
+        """Fetch the full contents of a single message."""
+        full_res = sess.get(f"{BASE}/messages/{message_id}", timeout=15)
+        return _json_response(full_res)
+    
+    seen = SeenIds()
+    backoff = PollBackoff(poll)
+    config = load_config()
+    last_etag: Optional[str] = None
     try:
         while True:
             try:
-                inbox_res = requests.get(f"{BASE}/messages", headers=headers, timeout=15)
-                inbox_res.raise_for_status()
-                inbox = inbox_res.json()["hydra:member"]
+                headers = {"If-None-Match": last_etag} if last_etag else None
+                inbox_res = sess.get(f"{BASE}/messages", headers=headers, timeout=15)
+                # A 304 means the inbox is unchanged and decodes to an empty body
+                inbox = _json_response(inbox_res).get("hydra:member", [])
                 
-                for m in inbox:
-                    if m["id"] in seen:
+                new_ids = [m["id"] for m in inbox if m["id"] not in seen]
+                
+                new_messages = 0
+                for message_id, full in _fetch_concurrently(fetch_message, new_ids):
+                    if full is None:
+                        # Left unseen so the next poll retries it
                         continue
                     
-                    seen.add(m["id"])
-                    
-                    full_res = requests.get(f"{BASE}/messages/{m['id']}", headers=headers, timeout=15)
-                    full_res.raise_for_status()
-                    full = full_res.json()
-                    
                     print_email(
                         "mail.gw",
                         address,
@@ -591,13 +1028,25 @@ def run_mail_gw(poll: int = 5) -> None:
                         full.get("createdAt"),
                         full.get("text", ""),
                         full,
+                        config=config,
                     )
+                    seen.add(message_id)
+                    new_messages += 1
+                
+                # Only remember the ETag once every new message has been shown,
+                # otherwise a 304 on the next poll would hide the failed ones
+                if inbox_res.status_code != 304 and new_messages == len(new_ids):
+                    last_etag = inbox_res.headers.get("ETag")
+                
+                backoff.record(new_messages)
             except requests.RequestException as e:
-                LOGGER.warning(f"Network error during polling: {e}")
+                LOGGER.warning(f"[mail.gw] Network error during polling: {e}")
+                backoff.record_error()
             except Exception as e:
-                LOGGER.warning(f"Error during polling: {e}")
+                LOGGER.warning(f"[mail.gw] Error during polling: {e}")
+                backoff.record_error()
             
-            time.sleep(poll)
+            backoff.sleep()
     except KeyboardInterrupt:
         console.print("[info]Stopped listening; goodbye![/]")
 
@@ -605,42 +1054,63 @@ def run_mail_gw(poll: int = 5) -> None:
 # Provider 5 – dropmail.me
 ##############################################################################
 
+DROPMAIL_INTRODUCE_MUTATION = """
+mutation {
+  introduceSession {
+    id
+    expiresAt
+    addresses {
+      address
+    }
+  }
+}
+"""
+
+# Steady-state polls only ask for mail IDs; bodies are fetched once
+# something new shows up
+DROPMAIL_LIST_QUERY = """
+query($id: ID!){
+  session(id: $id){
+    mails{
+      id
+    }
+  }
+}
+"""
+
+DROPMAIL_FULL_QUERY = """
+query($id: ID!){
+  session(id: $id){
+    mails{
+      id
+      fromAddr
+      headerSubject
+      text
+      receivedAt
+    }
+  }
+}
+"""
+
 def run_dropmail_me(poll: int = 5) -> None:
     """Run the dropmail.me provider listener."""
     BASE = "https://dropmail.me/api/graphql"
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold cyan]Setting up dropmail.me account..."),
-        console=console,
-        transient=True,
-    ) as progress:
-        progress.add_task("setup", total=None)
-        
+    sess = make_requests_session()
+    sess.headers.update({"Content-Type": "application/json"})
+    
+    with setup_spinner("dropmail.me"):
         try:
             # Create a new session with a random token
             token = _rand_string(12)
-            query = """
-            mutation {
-              introduceSession {
-                id
-                expiresAt
-                addresses {
-                  address
-                }
-              }
-            }
-            """
+            url = f"{BASE}/{token}"
             
-            res = requests.post(
-                f"{BASE}/{token}",
-                json={"query": query},
-                headers={"Content-Type": "application/json"},
+            res = sess.post(
+                url,
+                data=_dumpb({"query": DROPMAIL_INTRODUCE_MUTATION}),
                 timeout=15
             )
-            res.raise_for_status()
-            
-            data = res.json().get("data", {})
+            data = _json_response(res).get("data", {})
             session = data.get("introduceSession", {})
             session_id = session.get("id")
             address = session.get("addresses", [{}])[0].get("address")
@@ -653,47 +1123,38 @@ def run_dropmail_me(poll: int = 5) -> None:
             raise APIError(f"API error: {e}") from e
     
     console.print(f"[success]✓[/] Email address ready: [bold]{address}[/]")
-    console.print(f"Polling every [bold]{poll}s[/] for new messages. Press [bold]Ctrl+C[/] to stop.\n")
+    print_polling_notice(poll)
+    
+    # The session ID never changes, so serialize the request bodies once
+    variables = {"id": session_id}
+    list_body = _dumpb({"query": DROPMAIL_LIST_QUERY, "variables": variables})
+    full_body = _dumpb({"query": DROPMAIL_FULL_QUERY, "variables": variables})
+    
+    def query_session(body: bytes) -> Optional[Dict[str, Any]]:
+        """Run a pre-encoded session query, returning None if the session is gone."""
+        res = sess.post(url, data=body, timeout=15)
+        return (_json_response(res).get("data") or {}).get("session")
     
-    seen: Set[str] = set()
+    seen = SeenIds()
+    backoff = PollBackoff(poll)
+    config = load_config()
     try:
-        query = """
-        query($id: ID!){
-          session(id: $id){
-            mails{
-              id
-              fromAddr
-              headerSubject
-              text
-              receivedAt
-            }
-          }
-        }
-        """
-        
         while True:
             try:
-                res = requests.post(
-                    f"{BASE}/{token}",
-                    json={"query": query, "variables": {"id": session_id}},
-                    headers={"Content-Type": "application/json"},
-                    timeout=15
-                )
-                res.raise_for_status()
-                
-                data = res.json().get("data", {})
-                session_data = data.get("session", {})
+                session_data = query_session(list_body)
                 
                 if not session_data:
-                    LOGGER.warning("Session expired or not found")
+                    LOGGER.warning("[dropmail.me] Session expired or not found")
                     break
                 
-                mails = session_data.get("mails", [])
+                new_ids = {m["id"] for m in session_data.get("mails", []) if m["id"] not in seen}
+                mails = []
+                if new_ids:
+                    full_data = query_session(full_body) or {}
+                    mails = [m for m in full_data.get("mails", []) if m["id"] in new_ids]
                 
+                new_messages = 0
                 for m in mails:
-                    if m["id"] in seen:
-                        continue
-                    
                     seen.add(m["id"])
                     
                     print_email(
@@ -704,13 +1165,19 @@ def run_dropmail_me(poll: int = 5) -> None:
                         m.get("receivedAt"),
                         m.get("text", ""),
                         m,
+                        config=config,
                     )
+                    new_messages += 1
+                
+                backoff.record(new_messages)
             except requests.RequestException as e:
-                LOGGER.warning(f"Network error during polling: {e}")
+                LOGGER.warning(f"[dropmail.me] Network error during polling: {e}")
+                backoff.record_error()
             except Exception as e:
-                LOGGER.warning(f"Error during polling: {e}")
+                LOGGER.warning(f"[dropmail.me] Error during polling: {e}")
+                backoff.record_error()
             
-            time.sleep(poll)
+            backoff.sleep()
     except KeyboardInterrupt:
         console.print("[info]Stopped listening; goodbye![/]")
 
@@ -726,6 +1193,50 @@ PROVIDERS: Dict[str, Callable[[int], None]] = {
     "dropmail.me": run_dropmail_me,
 }
 
+def run_provider(name: str, poll: int, rush: bool = False) -> None:
+    """Run a single provider listener by name."""
+    if name == "tempmail.lol" and rush:
+        run_tempmail_lol(poll=poll, rush=True)
+    else:
+        PROVIDERS[name](poll=poll)
+
+def run_providers(names: List[str], poll: int, rush: bool = False) -> None:
+    """Watch several providers at once from a single process.
+    
+    Each listener runs in its own daemon thread and spends nearly all of its
+    time sleeping between polls, so the extra providers cost next to nothing.
+    A provider that fails to set up is logged and the others keep running;
+    if none of them come up, the first error is re-raised.
+    """
+    failures: List[ProviderError] = []
+    
+    def watch(name: str) -> None:
+        """Run one provider, logging setup failures instead of raising."""
+        try:
+            run_provider(name, poll=poll, rush=rush)
+        except ProviderError as e:
+            LOGGER.error(f"[{name}] {e}")
+            failures.append(e)
+    
+    threads = [
+        threading.Thread(target=watch, args=(name,), name=name, daemon=True)
+        for name in names
+    ]
+    for thread in threads:
+        thread.start()
+    
+    try:
+        # Join with a timeout so Ctrl+C still reaches the main thread
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(0.5)
+    except KeyboardInterrupt:
+        console.print("[info]Stopped listening; goodbye![/]")
+        return
+    
+    if len(failures) == len(threads):
+        raise failures[0]
+
 def print_ascii_banner() -> None:
     """Print the ASCII art banner."""
     # Clear the screen before printing banner
@@ -745,6 +1256,8 @@ def print_ascii_banner() -> None:
 
 def interactive_menu() -> Tuple[str, int]:
     """Display an interactive menu for provider selection."""
+    from rich.table import Table
+    
     print_ascii_banner()
     
     config = load_config()
@@ -789,9 +1302,10 @@ def interactive_menu() -> Tuple[str, int]:
         console.print("[warning]Invalid polling interval. Please enter a positive number.[/]")
     
     # Save selections as defaults for next time
-    config["default_provider"] = provider
-    config["poll_interval"] = poll
-    save_config(config)
+    if config.get("default_provider") != provider or config.get("poll_interval") != poll:
+        config["default_provider"] = provider
+        config["poll_interval"] = poll
+        save_config(config)
     
     return provider, poll
 
@@ -804,9 +1318,11 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     )
     parser.add_argument(
         "provider",
-        nargs="?",
-        choices=list(PROVIDERS.keys()),
-        help="Temp-mail provider to use. If omitted, an interactive menu is shown.",
+        nargs="*",
+        help=(
+            f"Temp-mail provider(s) to use ({', '.join(PROVIDERS)}). Several providers "
+            "are watched at once from one process. If omitted, an interactive menu is shown."
+        ),
     )
     parser.add_argument(
         "--poll", "-p",
@@ -830,6 +1346,16 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Don't save received messages to history.",
     )
+    parser.add_argument(
+        "--history", "-H",
+        action="store_true",
+        help="Show saved messages instead of watching an inbox.",
+    )
+    parser.add_argument(
+        "--batch", "-a",
+        action="store_true",
+        help="With --history, print all messages at once without prompting.",
+    )
     parser.add_argument(
         "--version", "-v",
         action="version",
@@ -838,11 +1364,23 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     
     args = parser.parse_args(argv)
     
-    # Update config with CLI options
-    config["poll_interval"] = args.poll
-    config["display_mode"] = args.display
-    config["save_messages"] = not args.no_save
-    save_config(config)
+    # argparse rejects an empty nargs="*" list when choices are set, so validate here
+    for name in args.provider:
+        if name not in PROVIDERS:
+            parser.error(
+                f"argument provider: invalid choice: {name!r} "
+                f"(choose from {', '.join(map(repr, PROVIDERS))})"
+            )
+    
+    # Update config with CLI options, only touching the disk if something changed
+    overrides = {
+        "poll_interval": args.poll,
+        "display_mode": args.display,
+        "save_messages": not args.no_save,
+    }
+    if any(config.get(key) != value for key, value in overrides.items()):
+        config.update(overrides)
+        save_config(config)
     
     return args
 
@@ -855,22 +1393,27 @@ def main() -> None:
         # Parse arguments
         args = parse_args()
         
+        if args.history:
+            view_history(batch=args.batch)
+            return
+        
         # If no provider specified, show interactive menu
         if not args.provider:
             provider_name, poll_interval = interactive_menu()
+            provider_names = [provider_name]
         else:
-            provider_name = args.provider
+            provider_names = list(dict.fromkeys(args.provider))
             poll_interval = args.poll
         
         # Print banner for non-interactive mode
         if args.provider:
             print_ascii_banner()
         
-        # Run the selected provider
-        if provider_name == "tempmail.lol" and args.rush:
-            run_tempmail_lol(poll=poll_interval, rush=True)
+        # Run the selected provider(s)
+        if len(provider_names) > 1:
+            run_providers(provider_names, poll=poll_interval, rush=args.rush)
         else:
-            PROVIDERS[provider_name](poll=poll_interval)
+            run_provider(provider_names[0], poll=poll_interval, rush=args.rush)
     except NetworkError as e:
         LOGGER.error(f"Network error: {e}")
         console.print("[error]Failed to connect to the service. Please check your internet connection.[/]")
@@ -893,70 +1436,188 @@ def main() -> None:
 # Additional features
 ##############################################################################
 
-def view_history() -> None:
-    """View email history from saved messages."""
-    if not HISTORY_FILE.exists():
+_HISTORY_PANEL_TEMPLATE = (
+    "Provider: [bold]{provider}[/]\n"
+    "Address: [bold]{address}[/]\n"
+    "Time: [bold]{time}[/]\n"
+    "From: [email_from]{from}[/]\n"
+    "Subject: [email_subject]{subject}[/]\n\n"
+    "{body}"
+)
+
+class _HistoryFields(dict):
+    """Template fields for a history panel that fill gaps with placeholders."""
+    
+    DEFAULTS = {"provider": "unknown", "address": "unknown", "subject": "(no subject)"}
+    
+    def __missing__(self, key: str) -> str:
+        return self.DEFAULTS.get(key, "(unknown)")
+
+def _history_panel(idx: int, entry: Dict[str, Any]) -> Any:
+    """Build the Rich panel for one history entry."""
+    from rich.markup import escape
+    from rich.panel import Panel
+    
+    message = entry.get("message") or {}
+    fields = _HistoryFields(message)
+    for key in ("provider", "address"):
+        if key in entry:
+            fields[key] = entry[key]
+    fields["time"] = _format_timestamp(entry.get("timestamp"))
+    # Slice before stripping so huge bodies aren't scanned in full
+    fields["body"] = (message.get("body") or "(no body)")[:500].strip()
+    # Saved messages are arbitrary text; keep their brackets out of the markup
+    for key in ("provider", "address", "time", "from", "subject", "body"):
+        if key in fields:
+            fields[key] = escape(str(fields[key]))
+    
+    return Panel(
+        _HISTORY_PANEL_TEMPLATE.format_map(fields),
+        title=f"Message #{idx}",
+        **_EMAIL_PANEL_STYLE,
+    )
+
+def view_history(batch: bool = False) -> None:
+    """View email history from saved messages.
+    
+    Interactive mode shows one message at a time. With batch=True every
+    message is rendered in a single print, which suits piping to a pager.
+    """
+    from rich.markup import escape
+    
+    st = None if _HISTORY_KNOWN_EMPTY else _history_stat()
+    if st is None:
         console.print("[warning]No message history found.[/]")
         return
     
     try:
-        with open(HISTORY_FILE, "r") as f:
-            history = json.load(f)
+        total = _history_size(st)
         
-        if not history:
+        if not total:
             console.print("[warning]Message history is empty.[/]")
             return
         
-        console.print(f"[header]Message History[/] ({len(history)} entries)")
+        console.print(f"[header]Message History[/] ({total} entries)")
         
-        for idx, entry in enumerate(history, 1):
-            provider = entry.get("provider", "unknown")
-            address = entry.get("address", "unknown")
-            timestamp = entry.get("timestamp", "unknown")
-            message = entry.get("message", {})
+        if batch:
+            from rich.console import Group
             
-            panel = Panel(
-                f"Provider: [bold]{provider}[/]\n"
-                f"Address: [bold]{address}[/]\n"
-                f"Time: [bold]{_format_timestamp(timestamp)}[/]\n"
-                f"From: [email_from]{message.get('from', '(unknown)')}[/]\n"
-                f"Subject: [email_subject]{message.get('subject', '(no subject)')}[/]\n\n"
-                f"{message.get('body', '(no body)').strip()[:500]}",
-                title=f"Message #{idx}",
-                title_align="left",
-                border_style="cyan"
-            )
-            console.print(panel)
+            panels = [_history_panel(idx, entry) for idx, entry in enumerate(_iter_history(st), 1)]
+            console.print(Group(*panels))
+            return
+        
+        from rich.text import Text
+        
+        # Parse the prompt markup once; only the counter changes per entry
+        prompt_prefix = Text.from_markup("[bold]Press Enter to view next message or 'q' to quit[/] ")
+        
+        # Entries are parsed as they are shown, so the first panel appears
+        # without waiting for the whole file
+        for idx, entry in enumerate(_iter_history(st), 1):
+            console.print(_history_panel(idx, entry))
             
-            if idx < len(history):
-                continue_viewing = console.input(
-                    f"[bold]Press Enter to view next message or 'q' to quit[/] [{idx}/{len(history)}]: "
-                )
+            if idx < total:
+                prompt = prompt_prefix.copy()
+                prompt.append(f"[{idx}/{total}]: ")
+                continue_viewing = console.input(prompt)
                 if continue_viewing.lower() == 'q':
                     break
-    except Exception as e:
-        console.print(f"[error]Error viewing history: {e}[/]")
+    except (OSError, ValueError) as e:
+        # ValueError covers json/orjson decode errors
+        console.print(f"[error]Error viewing history: {escape(str(e))}[/]")
+
+# Export format -> (optional package it needs, default output file)
+EXPORT_FORMATS: Dict[str, Tuple[Optional[str], str]] = {
+    "json": (None, "email_export.jsonl"),
+    "msgpack": ("msgpack", "email_export.msgpack"),
+    "cbor": ("cbor2", "email_export.cbor"),
+}
+
+def _encode_binary_export(history: List[Dict[str, Any]], fmt: str) -> bytes:
+    """Encode history as a MessagePack or CBOR array."""
+    if fmt == "msgpack":
+        import msgpack
+        return msgpack.packb(history, use_bin_type=True)
+    import cbor2
+    return cbor2.dumps(history)
 
-def export_emails(output_file: str = "email_export.json") -> None:
-    """Export emails to a JSON file."""
-    if not HISTORY_FILE.exists():
+def export_emails(
+    output_file: Optional[str] = None,
+    pretty: bool = False,
+    fmt: str = "json",
+) -> None:
+    """Export emails to a file.
+    
+    By default the newest JSON Lines history entries are copied byte-for-byte
+    without being parsed. With pretty=True it is re-encoded as an indented JSON array.
+    fmt="msgpack" or fmt="cbor" writes a compact binary array instead, which
+    is a good fit for archiving; these need the msgpack or cbor2 package.
+    """
+    if fmt not in EXPORT_FORMATS:
+        console.print(f"[error]Unknown export format: {fmt} (choose from {', '.join(EXPORT_FORMATS)})[/]")
+        return
+    
+    st = None if _HISTORY_KNOWN_EMPTY else _history_stat()
+    if st is None:
         console.print("[warning]No message history to export.[/]")
         return
     
+    package, default_file = EXPORT_FORMATS[fmt]
+    if output_file is None:
+        output_file = "email_export.json" if fmt == "json" and pretty else default_file
+    
+    # Exporting onto the history file would truncate it before it is read
     try:
-        with open(HISTORY_FILE, "r") as f:
-            history = json.load(f)
-        
-        with open(output_file, "w") as f:
-            json.dump(history, f, indent=2)
+        same_file = os.path.samefile(HISTORY_FILE, output_file)
+    except OSError:
+        same_file = os.path.abspath(HISTORY_FILE) == os.path.abspath(output_file)
+    if same_file:
+        console.print("[info]Destination is the history file itself, nothing to do[/]")
+        return
+    
+    try:
+        if fmt != "json":
+            history = _load_history(st)
+            count = len(history)
+            # Encode before opening so a missing package leaves no empty file behind
+            payload = _encode_binary_export(history, fmt)
+            with open(output_file, "wb") as f:
+                f.write(payload)
+        elif pretty:
+            history = _load_history(st)
+            count = len(history)
+            with open(output_file, "w", encoding="utf-8", buffering=HISTORY_WRITE_BUFFER) as f:
+                f.write(_dumps(history, indent=True))
+        else:
+            import mmap
+            import shutil
+            
+            # Stream only the entries within the history limit; the file itself
+            # is left alone, trimming is the append path's job
+            max_entries = load_config().get("max_history_entries", 50)
+            with _HISTORY_LOCK, open(HISTORY_FILE, "rb") as src, open(output_file, "wb", buffering=0) as dst:
+                count = 0
+                # mmap can't map an empty file
+                if os.fstat(src.fileno()).st_size:
+                    with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        start, count = _history_tail(mm, max_entries)
+                        mm.seek(start)
+                        # copyfileobj does its own chunking, so dst stays unbuffered
+                        shutil.copyfileobj(mm, dst, HISTORY_WRITE_BUFFER)
         
-        console.print(f"[success]Successfully exported {len(history)} messages to {output_file}[/]")
-    except Exception as e:
+        console.print(f"[success]Successfully exported {count} messages to {output_file}[/]")
+    except ImportError:
+        console.print(f"[error]{fmt} export needs the {package} package: pip install {package}[/]")
+    except (OSError, ValueError) as e:
         console.print(f"[error]Error exporting emails: {e}[/]")
 
 def clear_history() -> None:
     """Clear email history."""
-    if not HISTORY_FILE.exists():
+    global _HISTORY_LINES, _HISTORY_KNOWN_EMPTY
+    
+    # The size is enough to tell whether there is anything to delete
+    st = None if _HISTORY_KNOWN_EMPTY else _history_stat()
+    if st is None or st.st_size == 0:
         console.print("[warning]No message history to clear.[/]")
         return
     
@@ -966,10 +1627,17 @@ def clear_history() -> None:
         return
     
     try:
-        os.remove(HISTORY_FILE)
-        console.print("[success]Message history cleared successfully.[/]")
-    except Exception as e:
+        HISTORY_FILE.unlink()
+    except FileNotFoundError:
+        # Already gone, e.g. removed by another instance; the result is the same
+        pass
+    except OSError as e:
         console.print(f"[error]Error clearing history: {e}[/]")
+        return
+    
+    _HISTORY_LINES = 0
+    _HISTORY_KNOWN_EMPTY = True
+    console.print("[success]Message history cleared successfully.[/]")
 
 ##############################################################################
 # Entry point